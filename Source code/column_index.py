@@ -0,0 +1,51 @@
+"""
+Smart ETL - Column Index Module
+Column classification computed once from a DataFrame schema and shared across stages.
+"""
+
+import pandas as pd
+from dataclasses import dataclass
+from typing import Tuple
+
+# dtype.kind codes selected by select_dtypes(include=[np.number])
+NUMERIC_KINDS = frozenset('iufcm')
+NON_TEXT_KINDS = NUMERIC_KINDS | frozenset('bM')
+
+@dataclass(frozen=True, eq=False)
+class ColumnIndex:
+    """
+    Column names grouped by dtype family, derived from a single pass over
+    ``data.dtypes``. Stages accept an index built upstream and only rebuild
+    it when the frame's schema no longer matches.
+    """
+    columns: pd.Index
+    dtypes: tuple
+    numeric: Tuple[str, ...]
+    text: Tuple[str, ...]
+    
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "ColumnIndex":
+        """Classify every column of a DataFrame by its dtype kind"""
+        dtypes = tuple(data.dtypes.to_numpy())
+        names = data.columns.tolist()
+        kinds = [dtype.kind for dtype in dtypes]
+        
+        numeric = tuple(column for column, kind in zip(names, kinds)
+                        if kind in NUMERIC_KINDS)
+        text = tuple(column for column, kind, dtype in zip(names, kinds, dtypes)
+                     if kind not in NON_TEXT_KINDS and not isinstance(dtype, pd.CategoricalDtype))
+        
+        return cls(columns=data.columns, dtypes=dtypes, numeric=numeric, text=text)
+    
+    @classmethod
+    def ensure(cls, data: pd.DataFrame, column_index: "ColumnIndex" = None) -> "ColumnIndex":
+        """Return column_index if it still describes data, otherwise rebuild it"""
+        if column_index is not None and column_index.matches(data):
+            return column_index
+        return cls.from_frame(data)
+    
+    def matches(self, data: pd.DataFrame) -> bool:
+        """Check whether data still has the schema this index was built from"""
+        # Unchanged frames keep the same columns object and dtype singletons,
+        # so both checks are identity comparisons in the common case
+        return data.columns is self.columns and tuple(data.dtypes.to_numpy()) == self.dtypes
\ No newline at end of file
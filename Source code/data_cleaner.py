@@ -7,7 +7,6 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
 import warnings
-warnings.filterwarnings('ignore')
 
 class DataProfiler:
     def __init__(self):
@@ -79,7 +78,9 @@ class DataProfiler:
         
         # Try to convert to datetime
         try:
-            pd.to_datetime(series, errors='raise')
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                pd.to_datetime(series, errors='raise')
             return True
         except:
             return False
@@ -5,63 +5,404 @@ Automated data analysis and profiling for intelligent ETL processing.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+import os
+import re
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 import warnings
-warnings.filterwarnings('ignore')
+
+from .column_index import ColumnIndex
 
 class DataProfiler:
-    def __init__(self):
+    BACKENDS = ('pandas', 'polars', 'pyarrow')
+    DATE_PATTERN = re.compile(r'^\s*\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}')
+    # pd.api.types.infer_dtype results that settle an object column's type
+    # without running the datetime/categorical probes
+    OBJECT_TYPE_MAP = {
+        'integer': 'numerical',
+        'floating': 'numerical',
+        'mixed-integer-float': 'numerical',
+        'decimal': 'numerical',
+        'boolean': 'categorical',
+        'datetime': 'datetime',
+        'datetime64': 'datetime',
+        'date': 'datetime'
+    }
+    
+    def __init__(self, backend: str = 'pandas'):
+        """
+        Args:
+            backend: Engine for the full-frame null and duplicate scans,
+                'pandas', 'polars' (multi-threaded, requires polars) or
+                'pyarrow' (Arrow compute kernels)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        
+        self.backend = backend
         self.profile_report = {}
         self.data_types = {}
     
-    def analyze(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def analyze(self, data: pd.DataFrame,
+                column_index: Optional[ColumnIndex] = None) -> Dict[str, Any]:
         """
         Comprehensive data analysis and profiling
         
         Args:
             data: Input DataFrame for profiling
+            column_index: Optional precomputed column classification for data
             
         Returns:
             Dictionary containing complete profile report
         """
         print(" Starting data profiling...")
         
+        # Full-frame reductions are computed once and shared across sections
+        column_index = ColumnIndex.ensure(data, column_index)
+        n_rows, n_cols = data.shape
+        total_cells = n_rows * n_cols
+        if self.backend == 'polars':
+            n_duplicates, null_per_col = self._scan_with_polars(data)
+        elif self.backend == 'pyarrow':
+            n_duplicates, null_per_col = self._scan_with_pyarrow(data)
+        else:
+            n_duplicates, null_per_col = self._scan_with_pandas(data)
+        
         profile = {
-            'overview': self._get_overview(data),
+            'overview': self._get_overview(data, column_index, n_rows, n_cols, n_duplicates),
             'data_types': self._infer_data_types(data),
-            'missing_values': self._analyze_missing_values(data),
-            'statistical_summary': self._generate_statistical_summary(data),
-            'quality_metrics': self._calculate_quality_metrics(data)
+            'missing_values': self._analyze_missing_values(null_per_col, n_rows, total_cells),
+            'statistical_summary': self._generate_statistical_summary(data, column_index),
+            'quality_metrics': self._calculate_quality_metrics(null_per_col, n_rows, total_cells, n_duplicates)
+        }
+        
+        self.profile_report = profile
+        print(" Data profiling completed!")
+        return profile
+    
+    def analyze_chunked(self, source: Union[str, Iterable[pd.DataFrame]],
+                        chunksize: int = 100_000) -> Dict[str, Any]:
+        """
+        Profile data that does not fit in memory by streaming it in chunks
+        
+        Per-column null counts and moments are merged chunk by chunk, and
+        duplicate rows are counted from 64-bit row hashes. Data types are
+        inferred from the first chunk.
+        
+        Args:
+            source: Path to a CSV file or an iterable of DataFrame chunks
+            chunksize: Rows per chunk when reading from a CSV path
+            
+        Returns:
+            Dictionary with the same sections as analyze(); the statistical
+            summary holds streaming moments (no quantiles)
+        """
+        print(" Starting chunked data profiling...")
+        
+        if isinstance(source, (str, os.PathLike)):
+            source = pd.read_csv(source, chunksize=chunksize)
+        
+        n_rows = 0
+        memory_bytes = 0
+        data_types = None
+        null_per_col = None
+        moments = None
+        row_hashes = []
+        
+        for chunk in source:
+            if data_types is None:
+                data_types = self._infer_data_types(chunk)
+                numerical_cols = chunk.select_dtypes(include=[np.number]).columns
+                null_per_col = pd.Series(0, index=chunk.columns)
+            
+            n_rows += len(chunk)
+            memory_bytes += chunk.memory_usage(deep=True).sum()
+            null_per_col += chunk.isnull().sum()
+            row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+            
+            chunk_moments = self._chunk_moments(chunk[numerical_cols])
+            moments = chunk_moments if moments is None else self._merge_moments(moments, chunk_moments)
+        
+        if data_types is None or n_rows == 0:
+            raise ValueError("No rows to profile")
+        
+        n_cols = len(null_per_col)
+        n_duplicates = n_rows - len(np.unique(np.concatenate(row_hashes)))
+        total_cells = n_rows * n_cols
+        
+        profile = {
+            'overview': {
+                'num_rows': n_rows,
+                'num_columns': n_cols,
+                'memory_usage': f"{memory_bytes / 1024**2:.2f} MB",
+                'duplicate_rows': n_duplicates
+            },
+            'data_types': data_types,
+            'missing_values': self._analyze_missing_values(null_per_col, n_rows, total_cells),
+            'statistical_summary': self._summarize_moments(moments),
+            'quality_metrics': self._calculate_quality_metrics(null_per_col, n_rows, total_cells, n_duplicates)
+        }
+        
+        self.profile_report = profile
+        print(" Data profiling completed!")
+        return profile
+    
+    def analyze_parquet(self, path: str, batch_size: int = 100_000,
+                        count_duplicates: bool = False) -> Dict[str, Any]:
+        """
+        Profile a Parquet file from its column statistics
+        
+        Row counts, null counts and min/max come from the row-group metadata;
+        only columns written without statistics are scanned. Data types are
+        inferred from the first batch only. Counting duplicate rows needs a
+        full scan, so it is opt-in; otherwise duplicate_rows is None, the
+        uniqueness score is NaN and the overall score has no duplicate penalty.
+        
+        Args:
+            path: Path to a Parquet file
+            batch_size: Rows in the type-inference batch and per duplicate-scan batch
+            count_duplicates: Stream every row to count duplicates from row hashes
+            
+        Returns:
+            Dictionary with the same sections as analyze(); the statistical
+            summary holds count, min and max per numerical column
+        """
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+        
+        print(" Starting Parquet metadata profiling...")
+        
+        parquet_file = pq.ParquetFile(path)
+        metadata = parquet_file.metadata
+        n_rows = metadata.num_rows
+        columns = [name for name in parquet_file.schema_arrow.names
+                   if not name.startswith('__index_level_')]
+        n_cols = len(columns)
+        
+        # Merge per-row-group statistics; None marks a column needing a scan
+        column_stats = {name: {'null_count': 0, 'min': None, 'max': None} for name in columns}
+        memory_bytes = 0
+        for rg_idx in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg_idx)
+            memory_bytes += row_group.total_byte_size
+            for col_idx in range(row_group.num_columns):
+                chunk = row_group.column(col_idx)
+                name = chunk.path_in_schema
+                if name not in column_stats or column_stats[name] is None:
+                    continue
+                stats = chunk.statistics
+                if stats is None or not stats.has_null_count or not stats.has_min_max:
+                    column_stats[name] = None
+                    continue
+                merged = column_stats[name]
+                merged['null_count'] += stats.null_count
+                merged['min'] = stats.min if merged['min'] is None else min(merged['min'], stats.min)
+                merged['max'] = stats.max if merged['max'] is None else max(merged['max'], stats.max)
+        
+        for name, stats in column_stats.items():
+            if stats is None:
+                column = parquet_file.read(columns=[name]).column(name)
+                min_max = pc.min_max(column)
+                column_stats[name] = {
+                    'null_count': column.null_count,
+                    'min': min_max['min'].as_py(),
+                    'max': min_max['max'].as_py()
+                }
+        
+        null_per_col = pd.Series({name: stats['null_count'] for name, stats in column_stats.items()})
+        
+        if n_rows == 0:
+            raise ValueError("No rows to profile")
+        
+        first_batch = next(parquet_file.iter_batches(batch_size=batch_size, columns=columns))
+        data_types = self._infer_data_types(first_batch.to_pandas())
+        
+        n_duplicates = None
+        if count_duplicates:
+            row_hashes = [
+                pd.util.hash_pandas_object(batch.to_pandas(), index=False).to_numpy()
+                for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+            ]
+            n_duplicates = n_rows - len(np.unique(np.concatenate(row_hashes)))
+        total_cells = n_rows * n_cols
+        
+        quality_metrics = self._calculate_quality_metrics(null_per_col, n_rows, total_cells,
+                                                          n_duplicates or 0)
+        if n_duplicates is None:
+            quality_metrics['overall_quality_score'] = quality_metrics['completeness_score']
+            quality_metrics['uniqueness_score'] = np.nan
+        
+        statistical_summary = {
+            name: {
+                'count': n_rows - column_stats[name]['null_count'],
+                'min': column_stats[name]['min'],
+                'max': column_stats[name]['max']
+            }
+            for name, dtype in data_types.items() if dtype == 'numerical'
+        }
+        
+        profile = {
+            'overview': {
+                'num_rows': n_rows,
+                'num_columns': n_cols,
+                'memory_usage': f"{memory_bytes / 1024**2:.2f} MB",
+                'duplicate_rows': n_duplicates
+            },
+            'data_types': data_types,
+            'missing_values': self._analyze_missing_values(null_per_col, n_rows, total_cells),
+            'statistical_summary': statistical_summary,
+            'quality_metrics': quality_metrics
         }
         
         self.profile_report = profile
         print(" Data profiling completed!")
         return profile
     
-    def _get_overview(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _chunk_moments(self, numeric: pd.DataFrame) -> pd.DataFrame:
+        """Count, mean, central moment sums and range per column of one chunk"""
+        mean = numeric.mean()
+        centered = numeric - mean
+        return pd.DataFrame({
+            'count': numeric.count(),
+            'mean': mean,
+            'm2': (centered ** 2).sum(),
+            'm3': (centered ** 3).sum(),
+            'min': numeric.min(),
+            'max': numeric.max()
+        })
+    
+    def _merge_moments(self, a: pd.DataFrame, b: pd.DataFrame) -> pd.DataFrame:
+        """Combine two chunk moment tables (Chan et al. pairwise update)"""
+        n_a, n_b = a['count'], b['count']
+        n = n_a + n_b
+        delta = (b['mean'] - a['mean']).fillna(0)
+        
+        # Columns that are all-null in one chunk keep the other chunk's stats
+        weight_b = (n_b / n).fillna(0)
+        cross = (n_a * n_b / n).fillna(0)
+        
+        return pd.DataFrame({
+            'count': n,
+            'mean': a['mean'].fillna(b['mean']) + delta * weight_b,
+            'm2': a['m2'] + b['m2'] + delta ** 2 * cross,
+            'm3': (a['m3'] + b['m3'] + delta ** 3 * cross * ((n_a - n_b) / n).fillna(0)
+                   + 3 * delta * ((n_a * b['m2'] - n_b * a['m2']) / n).fillna(0)),
+            'min': np.fmin(a['min'], b['min']),
+            'max': np.fmax(a['max'], b['max'])
+        })
+    
+    def _summarize_moments(self, moments: pd.DataFrame) -> Dict[str, Any]:
+        """Turn merged moments into statistics matching analyze()'s summary"""
+        if moments is None or moments.empty:
+            return {}
+        
+        n = moments['count']
+        variance = (moments['m2'] / (n - 1)).where(n > 1)
+        
+        # Adjusted Fisher-Pearson skewness, as computed by Series.skew()
+        m2, m3 = moments['m2'] / n, moments['m3'] / n
+        skewness = (np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5).where(n > 2)
+        skewness = skewness.mask((n > 2) & (m2 == 0), 0.0)
+        
+        stats = pd.DataFrame({
+            'count': n,
+            'mean': moments['mean'],
+            'std': np.sqrt(variance),
+            'min': moments['min'],
+            'max': moments['max'],
+            'variance': variance,
+            'skewness': skewness
+        })
+        return stats.T.to_dict()
+    
+    def _count_duplicate_rows(self, data: pd.DataFrame) -> int:
+        """Count rows repeating an earlier row"""
+        # A frame whose leading (typically ID) column is unique has no duplicate rows
+        if data.shape[1] > 0 and data.iloc[:, 0].is_unique:
+            return 0
+        return int(data.duplicated().sum())
+    
+    def _scan_with_pandas(self, data: pd.DataFrame) -> Tuple[int, pd.Series]:
+        """Count duplicate rows and per-column nulls with pandas"""
+        return self._count_duplicate_rows(data), data.isnull().sum()
+    
+    def _scan_with_polars(self, data: pd.DataFrame) -> Tuple[int, pd.Series]:
+        """Count duplicate rows and per-column nulls on an Arrow-backed Polars frame"""
+        import polars as pl
+        import pyarrow as pa
+        
+        # Object columns mixing scalar types have no Arrow type; pandas handles them
+        try:
+            pl_data = pl.from_pandas(data, nan_to_null=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pl.exceptions.PolarsError):
+            return self._scan_with_pandas(data)
+        
+        # Rows repeating an earlier row, matching DataFrame.duplicated() semantics
+        n_duplicates = pl_data.height - pl_data.n_unique() if pl_data.height else 0
+        null_per_col = pd.Series(pl_data.null_count().row(0), index=data.columns)
+        
+        return n_duplicates, null_per_col
+    
+    def _scan_with_pyarrow(self, data: pd.DataFrame) -> Tuple[int, pd.Series]:
+        """Count duplicate rows and per-column nulls on an Arrow table"""
+        import pyarrow as pa
+        
+        # Object columns mixing scalar types have no Arrow type; pandas handles them
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return self._scan_with_pandas(data)
+        
+        # Null counts are kept in the Arrow validity metadata; distinct rows
+        # come from a hash group-by over every column
+        null_per_col = pd.Series([column.null_count for column in table.columns], index=data.columns)
+        n_duplicates = table.num_rows - table.group_by(table.column_names).aggregate([]).num_rows
+        
+        return n_duplicates, null_per_col
+    
+    def _get_overview(self, data: pd.DataFrame, column_index: ColumnIndex, n_rows: int,
+                      n_cols: int, n_duplicates: int) -> Dict[str, Any]:
         """Get basic dataset overview"""
+        memory_bytes = data.memory_usage(deep=False).sum()
+        
+        # Estimate object payload from a sample instead of sizing every string
+        object_cols = list(column_index.text)
+        if n_rows > 0 and object_cols:
+            sample = data[object_cols].head(1000)
+            sample_payload = (sample.memory_usage(deep=True, index=False).sum()
+                              - sample.memory_usage(deep=False, index=False).sum())
+            memory_bytes += sample_payload * n_rows / len(sample)
+        
         return {
-            'num_rows': data.shape[0],
-            'num_columns': data.shape[1],
-            'memory_usage': f"{data.memory_usage(deep=True).sum() / 1024**2:.2f} MB",
-            'duplicate_rows': data.duplicated().sum()
+            'num_rows': n_rows,
+            'num_columns': n_cols,
+            'memory_usage': f"{memory_bytes / 1024**2:.2f} MB",
+            'duplicate_rows': n_duplicates
         }
     
     def _infer_data_types(self, data: pd.DataFrame) -> Dict[str, str]:
         """Intelligent data type inference"""
         type_mapping = {}
         
-        for column in data.columns:
+        for column, dtype in data.dtypes.items():
             col_data = data[column]
+            inferred = self._map_object_dtype(col_data) if dtype == object else None
             
+            # Object columns of non-string scalars are resolved by pandas' inference
+            if inferred == 'numerical':
+                type_mapping[column] = 'categorical' if col_data.nunique() < 10 else 'numerical'
+            elif inferred is not None:
+                type_mapping[column] = inferred
+            # Pandas categoricals are categorical by construction
+            elif isinstance(dtype, pd.CategoricalDtype):
+                type_mapping[column] = 'categorical'
             # Check for datetime
-            if self._is_datetime_column(col_data):
+            elif self._is_datetime_column(col_data):
                 type_mapping[column] = 'datetime'
             # Check for categorical
             elif self._is_categorical_column(col_data):
                 type_mapping[column] = 'categorical'
             # Check for numerical
-            elif pd.api.types.is_numeric_dtype(col_data):
+            elif pd.api.types.is_numeric_dtype(dtype):
                 if col_data.nunique() < 10:
                     type_mapping[column] = 'categorical'
                 else:
@@ -72,68 +413,104 @@ class DataProfiler:
         self.data_types = type_mapping
         return type_mapping
     
+    def _map_object_dtype(self, series: pd.Series) -> Optional[str]:
+        """Map an object column's inferred scalar type, or None when it needs probing"""
+        return self.OBJECT_TYPE_MAP.get(pd.api.types.infer_dtype(series, skipna=True))
+    
     def _is_datetime_column(self, series: pd.Series) -> bool:
         """Check if column contains datetime data"""
         if pd.api.types.is_datetime64_any_dtype(series):
             return True
         
-        # Try to convert to datetime
-        try:
-            pd.to_datetime(series, errors='raise')
-            return True
-        except:
+        # Numeric and boolean columns are never treated as dates
+        if pd.api.types.is_numeric_dtype(series):
+            return False
+        
+        sample = series.dropna().head(64)
+        if sample.empty:
             return False
+        
+        # Unless the header suggests a date, require a date-shaped first value
+        name = str(series.name).lower()
+        first_value = sample.iloc[0]
+        if (isinstance(first_value, str) and not self.DATE_PATTERN.match(first_value)
+                and 'date' not in name and 'time' not in name):
+            return False
+        
+        # Format-inference warnings from the parse probes are expected here
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            
+            # Probe the sample before paying for a full-column parse
+            if pd.to_datetime(sample, errors='coerce').notna().mean() <= 0.9:
+                return False
+            
+            # Try to convert to datetime
+            try:
+                pd.to_datetime(series, errors='raise')
+                return True
+            except (ValueError, TypeError):
+                return False
     
     def _is_categorical_column(self, series: pd.Series) -> bool:
         """Check if column is categorical"""
-        if series.dtype == 'object':
-            unique_ratio = series.nunique() / len(series)
-            return unique_ratio < 0.5 and series.nunique() < 100
+        if series.dtype == 'object' and len(series) > 0:
+            # Only the unique count is needed; the codes are discarded right away
+            n_unique = len(pd.factorize(series, use_na_sentinel=True)[1])
+            return n_unique / len(series) < 0.5 and n_unique < 100
         return False
     
-    def _analyze_missing_values(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_missing_values(self, missing_count: pd.Series, n_rows: int,
+                                total_cells: int) -> Dict[str, Any]:
         """Comprehensive missing value analysis"""
-        missing_count = data.isnull().sum()
-        missing_percentage = (missing_count / len(data)) * 100
+        missing_percentage = (missing_count / n_rows) * 100
+        total_missing = missing_count.sum()
         
         return {
-            'total_missing': missing_count.sum(),
-            'missing_percentage_total': (missing_count.sum() / (data.shape[0] * data.shape[1])) * 100,
+            'total_missing': total_missing,
+            'missing_percentage_total': (total_missing / total_cells) * 100 if total_cells else 0.0,
             'columns_missing': missing_count[missing_count > 0].to_dict(),
             'columns_missing_percentage': missing_percentage[missing_percentage > 0].to_dict()
         }
     
-    def _generate_statistical_summary(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _generate_statistical_summary(self, data: pd.DataFrame,
+                                      column_index: ColumnIndex) -> Dict[str, Any]:
         """Generate statistical summary for numerical columns"""
-        numerical_cols = data.select_dtypes(include=[np.number]).columns
+        numerical_cols = list(column_index.numeric)
         
         if len(numerical_cols) == 0:
             return {}
         
-        stats = data[numerical_cols].describe().to_dict()
+        numeric = data[numerical_cols]
         
-        # Add additional statistics
-        for col in numerical_cols:
-            stats[col]['variance'] = data[col].var()
-            stats[col]['skewness'] = data[col].skew()
-            
-        return stats
+        # Add additional statistics in one aggregation over all columns
+        extra = numeric.agg(['var', 'skew']).rename(index={'var': 'variance', 'skew': 'skewness'})
+        
+        return pd.concat([numeric.describe(), extra]).to_dict()
     
-    def _calculate_quality_metrics(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_quality_metrics(self, null_per_col: pd.Series, n_rows: int, total_cells: int,
+                                   n_duplicates: int) -> Dict[str, float]:
         """Calculate data quality metrics"""
-        total_cells = data.shape[0] * data.shape[1]
-        missing_cells = data.isnull().sum().sum()
+        # Scores are undefined for a frame without rows or columns
+        if n_rows == 0 or total_cells == 0:
+            return {
+                'overall_quality_score': np.nan,
+                'completeness_score': np.nan,
+                'uniqueness_score': np.nan
+            }
+        
+        missing_cells = null_per_col.sum()
         
-        quality_score = 100 * (1 - missing_cells / total_cells)
+        completeness_score = 100 * (1 - missing_cells / total_cells)
+        duplicate_ratio = n_duplicates / n_rows
         
         # Penalize for duplicates
-        duplicate_penalty = data.duplicated().sum() / len(data) * 10
-        quality_score -= duplicate_penalty
+        quality_score = completeness_score - duplicate_ratio * 10
         
         return {
             'overall_quality_score': max(0, quality_score),
-            'completeness_score': 100 * (1 - missing_cells / total_cells),
-            'uniqueness_score': 100 * (1 - data.duplicated().sum() / len(data))
+            'completeness_score': completeness_score,
+            'uniqueness_score': 100 * (1 - duplicate_ratio)
         }
     
     def generate_report(self) -> str:
@@ -7,39 +7,61 @@ import pandas as pd
 import numpy as np
 from sklearn.feature_selection import SelectKBest, f_classif, mutual_info_classif
 from sklearn.decomposition import PCA
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional
 import featuretools as ft
 
+from .column_index import ColumnIndex
+
 class FeatureEngineer:
-    def __init__(self, max_features: int = 50):
+    SELECTION_METHODS = ('mutual_info', 'lightgbm')
+    
+    def __init__(self, max_features: int = 50, selection_method: str = 'mutual_info'):
+        """
+        Args:
+            max_features: Number of features kept by supervised selection
+            selection_method: 'mutual_info' (SelectKBest) or 'lightgbm'
+                (gain importances from one multi-threaded fit, requires lightgbm)
+        """
+        if selection_method not in self.SELECTION_METHODS:
+            raise ValueError(f"Unknown selection method '{selection_method}', "
+                             f"expected one of {self.SELECTION_METHODS}")
+        
         self.max_features = max_features
+        self.selection_method = selection_method
         self.created_features = []
         self.selected_features = []
         self.feature_importance = {}
     
-    def create_features(self, data: pd.DataFrame, target_column: str = None) -> pd.DataFrame:
+    def create_features(self, data: pd.DataFrame, target_column: str = None,
+                        column_index: Optional[ColumnIndex] = None) -> pd.DataFrame:
         """
         Automated feature engineering
         
         Args:
             data: Cleaned input data
             target_column: Optional target for supervised feature selection
+            column_index: Optional precomputed column classification for data
             
         Returns:
             DataFrame with engineered features
         """
         print(" Starting feature engineering...")
         
-        engineered_data = data.copy()
+        # Stages never modify data; they add (or replace) columns in this buffer
+        # and the result is assembled once at the end
+        features = {}
+        column_index = ColumnIndex.ensure(data, column_index)
         
         # Create temporal features
-        engineered_data = self._create_temporal_features(engineered_data)
+        self._create_temporal_features(data, features)
         
         # Create interaction features
-        engineered_data = self._create_interaction_features(engineered_data)
+        self._create_interaction_features(data, features, column_index)
         
         # Create statistical features
-        engineered_data = self._create_statistical_features(engineered_data)
+        self._create_statistical_features(data, features, column_index)
+        
+        engineered_data = self._assemble_features(data, features)
         
         # Select best features
         if target_column and target_column in engineered_data.columns:
@@ -48,80 +70,128 @@ class FeatureEngineer:
         print(f" Feature engineering completed! Created {len(self.created_features)} new features")
         return engineered_data
     
-    def _create_temporal_features(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Create temporal features from datetime columns"""
-        engineered_data = data.copy()
+    def _assemble_features(self, data: pd.DataFrame, features: Dict[str, Any]) -> pd.DataFrame:
+        """Append new feature columns with a single concat and apply replaced columns"""
+        added = {name: values for name, values in features.items() if name not in data.columns}
+        engineered_data = pd.concat([data, pd.DataFrame(added, index=data.index)], axis=1)
         
+        for name in [name for name in features if name not in added]:
+            engineered_data[name] = features[name]
+        
+        return engineered_data
+    
+    def _numerical_columns(self, features: Dict[str, Any], column_index: ColumnIndex) -> List[str]:
+        """Numerical input columns followed by the numerical features created so far"""
+        numerical_cols = [col for col in column_index.numeric if col not in features]
+        numerical_cols.extend(
+            name for name, values in features.items()
+            if name not in column_index.columns and np.asarray(values).dtype.kind in 'iuf'
+        )
+        return numerical_cols
+    
+    def _column(self, data: pd.DataFrame, features: Dict[str, Any], column: str) -> pd.Series:
+        """Current values of a column, preferring a created or replaced feature"""
+        if column in features:
+            return pd.Series(features[column], index=data.index)
+        return data[column]
+    
+    def _create_temporal_features(self, data: pd.DataFrame, features: Dict[str, Any]) -> None:
+        """Create temporal features from datetime columns"""
         # Check for datetime columns (you would extend this based on your data)
         datetime_columns = []
-        for col in engineered_data.columns:
+        for col in data.columns:
             if 'date' in col.lower() or 'time' in col.lower():
                 datetime_columns.append(col)
         
         for col in datetime_columns:
             try:
                 # Convert to datetime
-                engineered_data[col] = pd.to_datetime(engineered_data[col])
+                dates = pd.to_datetime(data[col])
                 
                 # Extract temporal features
-                engineered_data[f'{col}_year'] = engineered_data[col].dt.year
-                engineered_data[f'{col}_month'] = engineered_data[col].dt.month
-                engineered_data[f'{col}_day'] = engineered_data[col].dt.day
-                engineered_data[f'{col}_dayofweek'] = engineered_data[col].dt.dayofweek
-                engineered_data[f'{col}_quarter'] = engineered_data[col].dt.quarter
+                parts = self._extract_date_parts(dates)
+                temporal_features = {f'{col}_{name}': values for name, values in parts.items()}
+                
+                features[col] = dates
+                features.update(temporal_features)
                 
-                self.created_features.extend([
-                    f'{col}_year', f'{col}_month', f'{col}_day',
-                    f'{col}_dayofweek', f'{col}_quarter'
-                ])
+                self.created_features.extend(temporal_features)
                 print(f" Created temporal features from '{col}'")
                 
             except:
                 continue
+    
+    def _extract_date_parts(self, dates: pd.Series) -> Dict[str, np.ndarray]:
+        """Extract calendar fields from a datetime Series using numpy unit casts"""
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
         
-        return engineered_data
+        days = dates.to_numpy(dtype='datetime64[D]')
+        months = days.astype('datetime64[M]')
+        years = days.astype('datetime64[Y]')
+        
+        # Compact dtypes: years fit int16 and the other parts fit int8
+        parts = {
+            'year': (years.astype(np.int64) + 1970).astype(np.int16),
+            'month': ((months - years).astype(np.int64) + 1).astype(np.int8),
+            'day': ((days - months).astype(np.int64) + 1).astype(np.int8),
+            # 1970-01-01 was a Thursday (dayofweek 3)
+            'dayofweek': ((days.astype(np.int64) + 3) % 7).astype(np.int8)
+        }
+        parts['quarter'] = (parts['month'] - 1) // 3 + 1
+        
+        missing = np.isnat(days)
+        if missing.any():
+            parts = {name: np.where(missing, np.nan, values) for name, values in parts.items()}
+        
+        return parts
     
-    def _create_interaction_features(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _create_interaction_features(self, data: pd.DataFrame, features: Dict[str, Any],
+                                     column_index: ColumnIndex) -> None:
         """Create interaction features between numerical columns"""
-        engineered_data = data.copy()
-        numerical_cols = data.select_dtypes(include=[np.number]).columns.tolist()
+        numerical_cols = self._numerical_columns(features, column_index)
         
         # Limit to top numerical columns to avoid combinatorial explosion
         if len(numerical_cols) > 5:
             numerical_cols = numerical_cols[:5]
         
+        columns = {col: self._column(data, features, col) for col in numerical_cols}
+        # Widen compact integer features (e.g. int16 years) so products cannot overflow
+        columns = {col: values.astype(np.int64) if values.dtype.kind in 'iu' else values
+                   for col, values in columns.items()}
+        nonzero = {col: bool((values != 0).all()) for col, values in columns.items()}
+        
         # Create interaction features
         for i, col1 in enumerate(numerical_cols):
             for col2 in numerical_cols[i+1:]:
                 # Multiplication interaction
-                engineered_data[f'{col1}_x_{col2}'] = engineered_data[col1] * engineered_data[col2]
+                features[f'{col1}_x_{col2}'] = (columns[col1] * columns[col2]).to_numpy()
                 self.created_features.append(f'{col1}_x_{col2}')
                 
                 # Ratio interaction (avoid division by zero)
-                if (engineered_data[col2] != 0).all():
-                    engineered_data[f'{col1}_div_{col2}'] = engineered_data[col1] / engineered_data[col2]
+                if nonzero[col2]:
+                    features[f'{col1}_div_{col2}'] = (columns[col1] / columns[col2]).to_numpy()
                     self.created_features.append(f'{col1}_div_{col2}')
         
         print(f" Created {len(self.created_features)} interaction features")
-        return engineered_data
     
-    def _create_statistical_features(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _create_statistical_features(self, data: pd.DataFrame, features: Dict[str, Any],
+                                     column_index: ColumnIndex) -> None:
         """Create statistical aggregation features"""
-        engineered_data = data.copy()
-        numerical_cols = data.select_dtypes(include=[np.number]).columns.tolist()
+        numerical_cols = self._numerical_columns(features, column_index)
         
         if len(numerical_cols) >= 3:
             # Create rolling statistics for first 3 numerical columns
+            rolling_features = {}
             for col in numerical_cols[:3]:
-                engineered_data[f'{col}_rolling_mean'] = engineered_data[col].rolling(window=3, min_periods=1).mean()
-                engineered_data[f'{col}_rolling_std'] = engineered_data[col].rolling(window=3, min_periods=1).std()
-                
-                self.created_features.extend([
-                    f'{col}_rolling_mean', f'{col}_rolling_std'
-                ])
+                rolling = self._column(data, features, col).rolling(window=3, min_periods=1)
+                rolling_features[f'{col}_rolling_mean'] = rolling.mean().to_numpy()
+                rolling_features[f'{col}_rolling_std'] = rolling.std().to_numpy()
+            
+            features.update(rolling_features)
+            self.created_features.extend(rolling_features)
         
         print(f" Created statistical aggregation features")
-        return engineered_data
     
     def _select_features(self, data: pd.DataFrame, target_column: str) -> pd.DataFrame:
         """Select most important features using statistical tests"""
@@ -134,16 +204,26 @@ class FeatureEngineer:
         if X_numeric.shape[1] == 0:
             return data
         
-        # Use mutual information for feature selection
-        selector = SelectKBest(score_func=mutual_info_classif, k=min(self.max_features, X_numeric.shape[1]))
-        X_selected = selector.fit_transform(X_numeric, y)
+        k = min(self.max_features, X_numeric.shape[1])
+        
+        if self.selection_method == 'lightgbm':
+            scores = self._lightgbm_importance(X_numeric, y)
+            
+            # Keep the k highest-gain features in their original column order
+            selected_mask = np.zeros(len(scores), dtype=bool)
+            selected_mask[np.argsort(scores)[::-1][:k]] = True
+        else:
+            # Use mutual information for feature selection
+            selector = SelectKBest(score_func=mutual_info_classif, k=k)
+            selector.fit(X_numeric, y)
+            selected_mask = selector.get_support()
+            scores = selector.scores_
         
         # Get selected feature names
-        selected_mask = selector.get_support()
         self.selected_features = X_numeric.columns[selected_mask].tolist()
         
         # Store feature importance scores
-        for i, (feature, score) in enumerate(zip(X_numeric.columns, selector.scores_)):
+        for feature, score in zip(X_numeric.columns, scores):
             self.feature_importance[feature] = score
         
         # Create result with selected features + target
@@ -153,6 +233,20 @@ class FeatureEngineer:
         print(f"   Selected {len(self.selected_features)} most important features")
         return result_data
     
+    def _lightgbm_importance(self, X: pd.DataFrame, y: pd.Series) -> np.ndarray:
+        """Gain-based feature importances from a single LightGBM fit"""
+        try:
+            import lightgbm as lgb
+        except ImportError as e:
+            raise ImportError(
+                "selection_method='lightgbm' requires the optional lightgbm package; "
+                "install it with 'pip install lightgbm' or use selection_method='mutual_info'"
+            ) from e
+        
+        model = lgb.LGBMClassifier(n_estimators=100, n_jobs=-1, verbose=-1)
+        model.fit(X, y)
+        return model.booster_.feature_importance(importance_type='gain')
+    
     def get_feature_summary(self) -> str:
         """Get feature engineering summary"""
         summary = []
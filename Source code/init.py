@@ -11,10 +11,12 @@ from .data_profiler import DataProfiler
 from .data_cleaner import DataCleaner
 from .feature_engineer import FeatureEngineer
 from .pipeline_generator import PipelineGenerator
+from .column_index import ColumnIndex
 
 __all__ = [
     "DataProfiler",
     "DataCleaner", 
     "FeatureEngineer",
-    "PipelineGenerator"
+    "PipelineGenerator",
+    "ColumnIndex"
 ]
\ No newline at end of file
@@ -92,22 +92,30 @@ class PipelineGenerator:
         params = step['parameters']
         
         if 'imputation' in params:
-            for col, strategy in params['imputation'].items():
-                if strategy == 'median':
-                    code_lines.append(f"    processed_data['{col}'].fillna(processed_data['{col}'].median(), inplace=True)")
-                elif strategy == 'mean':
-                    code_lines.append(f"    processed_data['{col}'].fillna(processed_data['{col}'].mean(), inplace=True)")
-                elif strategy == 'mode':
-                    code_lines.append(f"    processed_data['{col}'].fillna(processed_data['{col}'].mode()[0], inplace=True)")
+            # One fillna call with a per-column value dict instead of a call per column
+            fill_values = {
+                'median': "processed_data['{col}'].median()",
+                'mean': "processed_data['{col}'].mean()",
+                'mode': "processed_data['{col}'].mode()[0]"
+            }
+            fills = [(col, fill_values[strategy].format(col=col))
+                     for col, strategy in params['imputation'].items()
+                     if strategy in fill_values]
+            if fills:
+                code_lines.append("    processed_data = processed_data.fillna({")
+                code_lines.extend(f"        '{col}': {value}," for col, value in fills)
+                code_lines.append("    })")
         
         if 'encoding' in params:
-            for col, method in params['encoding'].items():
-                if method == 'one_hot':
-                    code_lines.append(f"    {col}_encoded = pd.get_dummies(processed_data['{col}'], prefix='{col}')")
-                    code_lines.append(f"    processed_data = pd.concat([processed_data, {col}_encoded], axis=1)")
-                    code_lines.append(f"    processed_data.drop('{col}', axis=1, inplace=True)")
-                elif method == 'label':
-                    code_lines.append(f"    le = LabelEncoder()")
+            one_hot_columns = [col for col, method in params['encoding'].items() if method == 'one_hot']
+            label_columns = [col for col, method in params['encoding'].items() if method == 'label']
+            
+            if one_hot_columns:
+                code_lines.append(f"    processed_data = pd.get_dummies(processed_data, columns={one_hot_columns})")
+            
+            if label_columns:
+                code_lines.append(f"    le = LabelEncoder()")
+                for col in label_columns:
                     code_lines.append(f"    processed_data['{col}'] = le.fit_transform(processed_data['{col}'].astype(str))")
         
         return code_lines
@@ -5,8 +5,14 @@ Script to load and prepare sample data for Smart ETL system.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import sys
 import os
 
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils import write_csv
+
 def create_sample_sales_data():
     """Create sample sales data with realistic patterns"""
     
@@ -39,43 +45,37 @@ def create_sample_sales_data():
     }
     
     # Generate sales data
-    sales_data = []
-    order_id = 1
+    num_transactions = 100
     start_date = datetime(2024, 1, 15)
     
-    for i in range(100):  # 100 transactions
-        product_id = np.random.choice(list(products.keys()))
-        product = products[product_id]
-        
-        # Create realistic patterns
-        customer_id = np.random.randint(101, 150)
-        quantity = np.random.poisson(2) or 1  # At least 1
-        order_date = start_date + timedelta(days=i)
-        
-        # Add some missing values and outliers for testing
-        unit_price = product['price']
-        if i == 5:  # Add an outlier
-            unit_price = 999.99
-        elif i == 10:  # Add missing value
-            unit_price = np.nan
-        
-        sales_data.append({
-            'order_id': order_id,
-            'customer_id': customer_id,
-            'product_id': product_id,
-            'order_date': order_date.strftime('%Y-%m-%d'),
-            'quantity': quantity,
-            'unit_price': unit_price,
-            'customer_city': np.random.choice(['New York', 'London', 'Tokyo', 'Paris', 'Sydney']),
-            'product_category': product['category'],
-            'customer_segment': np.random.choice(['Premium', 'Standard'], p=[0.3, 0.7]),
-            'promotion_applied': np.random.choice(['Yes', 'No'], p=[0.4, 0.6]),
-            'total_sales': quantity * unit_price
-        })
-        
-        order_id += 1
+    # Product lookup tables, gathered by index for every transaction at once
+    product_ids = np.array(list(products.keys()))
+    product_prices = np.array([product['price'] for product in products.values()])
+    product_categories = np.array([product['category'] for product in products.values()])
+    product_idx = np.random.randint(0, len(product_ids), num_transactions)
+    
+    # Create realistic patterns
+    quantity = np.maximum(np.random.poisson(2, num_transactions), 1)  # At least 1
+    order_dates = pd.date_range(start_date, periods=num_transactions, freq='D')
     
-    return pd.DataFrame(sales_data)
+    # Add some missing values and outliers for testing
+    unit_price = product_prices[product_idx]
+    unit_price[5] = 999.99  # outlier
+    unit_price[10] = np.nan  # missing value
+    
+    return pd.DataFrame({
+        'order_id': np.arange(1, num_transactions + 1),
+        'customer_id': np.random.randint(101, 150, num_transactions),
+        'product_id': product_ids[product_idx],
+        'order_date': order_dates.strftime('%Y-%m-%d'),
+        'quantity': quantity,
+        'unit_price': unit_price,
+        'customer_city': np.random.choice(['New York', 'London', 'Tokyo', 'Paris', 'Sydney'], num_transactions),
+        'product_category': product_categories[product_idx],
+        'customer_segment': np.random.choice(['Premium', 'Standard'], num_transactions, p=[0.3, 0.7]),
+        'promotion_applied': np.random.choice(['Yes', 'No'], num_transactions, p=[0.4, 0.6]),
+        'total_sales': quantity * unit_price
+    })
 
 def create_sample_customer_data():
     """Create sample customer data"""
@@ -120,14 +120,18 @@ def main():
     customer_df = create_sample_customer_data()
     
     # Save to CSV files
-    sales_df.to_csv('data/raw/sample_sales_data.csv', index=False)
-    customer_df.to_csv('data/raw/sample_customer_data.csv', index=False)
+    write_csv(sales_df, 'data/raw/sample_sales_data.csv')
+    write_csv(customer_df, 'data/raw/sample_customer_data.csv')
+    
+    # Parquet copies carry column statistics for DataProfiler.analyze_parquet
+    sales_df.to_parquet('data/raw/sample_sales_data.parquet', compression='zstd', index=False)
+    customer_df.to_parquet('data/raw/sample_customer_data.parquet', compression='zstd', index=False)
     
     print(f" Generated sales data: {sales_df.shape}")
     print(f" Generated customer data: {customer_df.shape}")
     print("📁 Files saved to data/raw/")
-    print("   - sample_sales_data.csv")
-    print("   - sample_customer_data.csv")
+    print("   - sample_sales_data.csv / .parquet")
+    print("   - sample_customer_data.csv / .parquet")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,9 +2,14 @@
 Demo script showing how to process raw data using Smart ETL system.
 """
 
+import hashlib
+import inspect
+import joblib
 import pandas as pd
+import polars as pl
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -12,29 +17,169 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.data_profiler import DataProfiler
 from src.data_cleaner import DataCleaner
 from src.feature_engineer import FeatureEngineer
+from src.utils import Config, write_csv
+
+# Raw files above this size are profiled in streamed batches
+LARGE_FILE_BYTES = 500 * 1024 ** 2
+
+# On-disk cache for profiling and cleaning results, keyed on file signatures
+# and CODE_VERSION; run with --clear-cache to empty it
+memory = joblib.Memory('.cache/etl', verbose=0)
+
+def source_fingerprint(package_dir):
+    """Hash every Python source file under package_dir, so edits to any of them change cache keys"""
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, package_dir).encode())
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+# joblib only tracks the cached functions' own code, not the src modules they
+# call (profiler, cleaner and their imports such as column_index)
+CODE_VERSION = source_fingerprint(os.path.dirname(inspect.getsourcefile(DataProfiler)))
+
+def fast_read_csv(path, columns=None, date_columns=()):
+    """
+    Read a CSV with polars' multi-threaded streaming reader.
+    
+    Args:
+        path: CSV file to read
+        columns: Optional subset of columns to materialize
+        date_columns: ISO date columns parsed during the scan
+        
+    Returns:
+        pandas DataFrame
+    """
+    query = pl.scan_csv(path).select(columns or pl.all())
+    if date_columns:
+        query = query.with_columns(pl.col(list(date_columns)).str.strptime(pl.Date))
+    return query.collect(engine='streaming').to_pandas()
+
+def peek_csv(path):
+    """
+    Get a CSV's shape without parsing its values.
+    
+    The schema comes from the header and polars counts rows without
+    materializing any columns.
+    
+    Returns:
+        Tuple of (rows, columns)
+    """
+    query = pl.scan_csv(path)
+    n_cols = len(query.collect_schema())
+    n_rows = query.select(pl.len()).collect().item()
+    return n_rows, n_cols
+
+def iter_batches(path, batch_size=100_000, date_columns=()):
+    """
+    Yield a CSV as pandas DataFrames of at most batch_size rows.
+    
+    Polars keeps a single reader open across batches, so peak memory is
+    bounded by the batch rather than the file. Date columns are parsed
+    during the scan, as in fast_read_csv.
+    """
+    query = pl.scan_csv(path)
+    if date_columns:
+        query = query.with_columns(pl.col(list(date_columns)).str.strptime(pl.Date))
+    for batch in query.collect_batches(chunk_size=batch_size):
+        yield batch.to_pandas()
+
+def file_signature(path):
+    """Return (mtime, size) for a file, used as a cache key instead of hashing its data"""
+    return os.path.getmtime(path), os.path.getsize(path)
+
+@memory.cache
+def profile_file(path, mtime, size, date_columns=(), code_version=CODE_VERSION):
+    """
+    Load and profile a raw CSV, reusing the cached result while the file is unchanged.
+    
+    Args:
+        path: CSV file to profile
+        mtime: File modification time (cache key)
+        size: File size in bytes (cache key)
+        date_columns: ISO date columns parsed during the scan
+        code_version: Fingerprint of the src package sources (cache key)
+        
+    Returns:
+        Tuple of (raw data, profile, profile report); raw data is None for
+        large files, which are profiled without ever being loaded whole
+    """
+    profiler = DataProfiler()
+    
+    # Large files are streamed so peak memory is bounded by one batch
+    if size > LARGE_FILE_BYTES:
+        data = None
+        profile = profiler.analyze_chunked(iter_batches(path, date_columns=date_columns))
+    else:
+        data = fast_read_csv(path, date_columns=date_columns)
+        profile = profiler.analyze(data)
+    return data, profile, profiler.generate_report()
+
+@memory.cache
+def clean_file(path, mtime, size, date_columns=(), code_version=CODE_VERSION):
+    """
+    Clean a raw CSV using its cached profile, reusing the cached result while the file is unchanged.
+    
+    Only profiling is streamed. Cleaning, and the feature engineering that
+    consumes its result, work on a whole DataFrame, so large files are loaded
+    in full here and peak memory is O(file size) at this step.
+    
+    Returns:
+        Tuple of (cleaned data, cleaning summary)
+    """
+    data, profile, _ = profile_file(path, mtime, size, date_columns, code_version)
+    if data is None:
+        data = fast_read_csv(path, date_columns=date_columns)
+    cleaner = DataCleaner()
+    cleaned_data = cleaner.clean_data(data, profile)
+    return cleaned_data, cleaner.get_cleaning_summary()
+
+def save_processed_data(data, name):
+    """
+    Save processed data in the configured output format.
+    
+    Args:
+        data: DataFrame to save
+        name: File name without extension
+        
+    Returns:
+        Path of the written file
+    """
+    if Config().get('output.format', 'parquet') == 'csv':
+        path = f'data/processed/{name}.csv'
+        write_csv(data, path)
+    else:
+        path = f'data/processed/{name}.parquet'
+        data.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+    return path
 
 def process_sales_data():
     """Demo: Process sales data using Smart ETL"""
     print("PROCESSING SALES DATA WITH SMART ETL")
     print("=" * 50)
     
+    raw_path = 'data/raw/sample_sales_data.csv'
+    signature = file_signature(raw_path)
+    
     # Load raw data
     print("1. Loading raw data...")
-    sales_data = pd.read_csv('data/raw/sample_sales_data.csv')
-    print(f"   Raw data shape: {sales_data.shape}")
+    print(f"   Raw data shape: {peek_csv(raw_path)}")
+    _, _, report = profile_file(raw_path, *signature)
     
     # Data Profiling
     print("\n2. Data Profiling...")
-    profiler = DataProfiler()
-    profile = profiler.analyze(sales_data)
-    print(profiler.generate_report())
+    print(report)
     
     # Data Cleaning
     print("\n3. Data Cleaning...")
-    cleaner = DataCleaner()
-    cleaned_data = cleaner.clean_data(sales_data, profile)
+    cleaned_data, cleaning_summary = clean_file(raw_path, *signature)
     print(f" Cleaned data shape: {cleaned_data.shape}")
-    print(cleaner.get_cleaning_summary())
+    print(cleaning_summary)
     
     # Feature Engineering
     print("\n4. Feature Engineering...")
@@ -49,8 +194,8 @@ def process_sales_data():
     
     # Save processed data
     print("\n5. Saving processed data...")
-    engineered_data.to_csv('data/processed/processed_sales_data.csv', index=False)
-    print(" Processed data saved to: data/processed/processed_sales_data.csv")
+    output_path = save_processed_data(engineered_data, 'processed_sales_data')
+    print(f" Processed data saved to: {output_path}")
     
     return engineered_data
 
@@ -59,40 +204,37 @@ def process_customer_data():
     print("\n PROCESSING CUSTOMER DATA WITH SMART ETL")
     print("=" * 50)
     
+    raw_path = 'data/raw/sample_customer_data.csv'
+    signature = file_signature(raw_path)
+    date_columns = ('join_date', 'last_purchase')
+    
     # Load raw data
     print("1. Loading raw data...")
-    customer_data = pd.read_csv('data/raw/sample_customer_data.csv')
-    print(f" Raw data shape: {customer_data.shape}")
+    print(f" Raw data shape: {peek_csv(raw_path)}")
+    _, _, report = profile_file(raw_path, *signature, date_columns)
     
     # Data Profiling
     print("\n2. Data Profiling...")
-    profiler = DataProfiler()
-    profile = profiler.analyze(customer_data)
-    print(profiler.generate_report())
+    print(report)
     
     # Data Cleaning
     print("\n3. Data Cleaning...")
-    cleaner = DataCleaner()
-    cleaned_data = cleaner.clean_data(customer_data, profile)
+    cleaned_data, cleaning_summary = clean_file(raw_path, *signature, date_columns)
     print(f"   Cleaned data shape: {cleaned_data.shape}")
-    print(cleaner.get_cleaning_summary())
+    print(cleaning_summary)
     
     # Feature Engineering
     print("\n4. Feature Engineering...")
     engineer = FeatureEngineer(max_features=15)
     
-    # Convert dates for feature engineering
-    cleaned_data['join_date'] = pd.to_datetime(cleaned_data['join_date'])
-    cleaned_data['last_purchase'] = pd.to_datetime(cleaned_data['last_purchase'])
-    
     engineered_data = engineer.create_features(cleaned_data, 'credit_score')
     print(f"   Engineered data shape: {engineered_data.shape}")
     print(engineer.get_feature_summary())
     
     # Save processed data
     print("\n5. Saving processed data...")
-    engineered_data.to_csv('data/processed/processed_customer_data.csv', index=False)
-    print(" Processed data saved to: data/processed/processed_customer_data.csv")
+    output_path = save_processed_data(engineered_data, 'processed_customer_data')
+    print(f" Processed data saved to: {output_path}")
     
     return engineered_data
 
@@ -102,18 +244,24 @@ def main():
     print("This demo shows how to process raw data using the Smart ETL system")
     print("=" * 60)
     
-    # Process both datasets
-    processed_sales = process_sales_data()
-    processed_customers = process_customer_data()
+    # The two pipelines share no state, so run them in separate processes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        sales_future = executor.submit(process_sales_data)
+        customers_future = executor.submit(process_customer_data)
+        processed_sales = sales_future.result()
+        processed_customers = customers_future.result()
     
     print("\n" + "=" * 60)
     print("DEMO COMPLETED SUCCESSFULLY!")
     print(f"Processed sales data: {processed_sales.shape}")
     print(f" Processed customer data: {processed_customers.shape}")
+    extension = Config().get('output.format', 'parquet')
     print("\n Generated files:")
-    print("   - data/processed/processed_sales_data.csv")
-    print("   - data/processed/processed_customer_data.csv")
+    print(f"   - data/processed/processed_sales_data.{extension}")
+    print(f"   - data/processed/processed_customer_data.{extension}")
     print("\n The data is now ready for machine learning!")
 
 if __name__ == "__main__":
+    if '--clear-cache' in sys.argv:
+        memory.clear(warn=False)
     main()
\ No newline at end of file
@@ -40,6 +40,10 @@ def main():
         'rating': np.where(np.random.random(100) > 0.05, np.random.randint(1, 6, 100), 999)  # outliers
     })
     
+    # Low-cardinality labels are stored as integer codes plus a small category table
+    for column in ['customer_segment', 'region', 'product_id', 'weekday']:
+        data[column] = data[column].astype('category')
+    
     print(f"Advanced data shape: {data.shape}")
     print("Data preview:")
     print(data.head())
@@ -80,8 +84,8 @@ def main():
     engineer = FeatureEngineer(max_features=12)
     
     # Create multiple target scenarios
-    cleaned_data['large_transaction'] = (cleaned_data['amount'] > 120).astype(int)
-    cleaned_data['high_quantity'] = (cleaned_data['quantity'] > 3).astype(int)
+    cleaned_data['large_transaction'] = (cleaned_data['amount'].to_numpy() > 120).view(np.int8)
+    cleaned_data['high_quantity'] = (cleaned_data['quantity'].to_numpy() > 3).view(np.int8)
     
     engineered_data = engineer.create_features(cleaned_data, 'large_transaction')
     print(f"Engineered data shape: {engineered_data.shape}")
@@ -53,7 +53,7 @@ def main():
     engineer = FeatureEngineer(max_features=8)
     
     # Create a target variable
-    cleaned_data['high_spender'] = (cleaned_data['purchase_amount'] > 300).astype(int)
+    cleaned_data['high_spender'] = (cleaned_data['purchase_amount'].to_numpy() > 300).view(np.int8)
     
     final_data = engineer.create_features(cleaned_data, 'high_spender')
     print(f"Final data shape: {final_data.shape}")
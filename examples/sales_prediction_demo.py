@@ -5,6 +5,7 @@ Complete workflow from raw data to model-ready features.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import sys
 import os
 
@@ -13,6 +14,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.data_profiler import DataProfiler
 from src.data_cleaner import DataCleaner
 from src.feature_engineer import FeatureEngineer
+from src.utils import Config, write_csv
 
 def load_and_process_sales_data():
     """Complete sales data processing demo"""
@@ -21,7 +23,7 @@ def load_and_process_sales_data():
     
     # Load sample sales data (or create if not exists)
     try:
-        sales_data = pd.read_csv('../data/raw/sample_sales_data.csv')
+        sales_data = pd.read_csv('../data/raw/sample_sales_data.csv', parse_dates=['order_date'])
         print("Loaded existing sales data")
     except:
         print("Creating sample sales data...")
@@ -53,9 +55,10 @@ def load_and_process_sales_data():
     print("\n3.  FEATURE ENGINEERING...")
     
     # Create target variable: high-value customers (top 30% by total sales)
-    cleaned_data['total_sales'] = cleaned_data['quantity'] * cleaned_data['unit_price']
-    total_sales_threshold = cleaned_data['total_sales'].quantile(0.7)
-    cleaned_data['high_value_customer'] = (cleaned_data['total_sales'] > total_sales_threshold).astype(int)
+    total_sales = cleaned_data['quantity'].to_numpy() * cleaned_data['unit_price'].to_numpy()
+    total_sales_threshold = np.nanquantile(total_sales, 0.7)
+    cleaned_data['total_sales'] = total_sales
+    cleaned_data['high_value_customer'] = (total_sales > total_sales_threshold).view(np.int8)
     
     print(f"Target variable created: 'high_value_customer'")
     print(f"High-value threshold: ${total_sales_threshold:.2f}")
@@ -77,10 +80,12 @@ def load_and_process_sales_data():
     
     return final_data
 
+def dictionary_column(options, codes):
+    """Build a dictionary-encoded Arrow column from option labels and their codes"""
+    return pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int8()), pa.array(options))
+
 def create_sample_sales_data():
     """Create sample sales data for demo"""
-    np.random.seed(42)
-    
     products = {
         201: {'name': 'Laptop', 'category': 'Electronics', 'price': 899.99},
         202: {'name': 'Smartphone', 'category': 'Electronics', 'price': 699.99},
@@ -89,27 +94,40 @@ def create_sample_sales_data():
         205: {'name': 'Chair', 'category': 'Furniture', 'price': 149.99}
     }
     
-    sales_data = []
-    for i in range(50):
-        product_id = np.random.choice(list(products.keys()))
-        product = products[product_id]
-        
-        sales_data.append({
-            'order_id': i + 1,
-            'customer_id': np.random.randint(1001, 1020),
-            'product_id': product_id,
-            'order_date': f"2024-{np.random.randint(1,13):02d}-{np.random.randint(1,28):02d}",
-            'quantity': np.random.poisson(2) + 1,
-            'unit_price': product['price'],
-            'customer_city': np.random.choice(['New York', 'London', 'Tokyo', 'Paris']),
-            'product_category': product['category'],
-            'customer_segment': np.random.choice(['Premium', 'Standard'], p=[0.4, 0.6]),
-            'promotion_applied': np.random.choice(['Yes', 'No'], p=[0.3, 0.7])
-        })
-    
-    df = pd.DataFrame(sales_data)
+    # Draw every column at once, gathering product attributes by index
+    rng = np.random.default_rng(42)
+    num_orders = 50
+    product_ids = np.array(list(products.keys()))
+    product_prices = np.array([product['price'] for product in products.values()])
+    categories, category_codes = np.unique([product['category'] for product in products.values()],
+                                           return_inverse=True)
+    product_idx = rng.integers(0, len(product_ids), num_orders)
+    
+    order_dates = pd.to_datetime(pd.DataFrame({
+        'year': 2024,
+        'month': rng.integers(1, 13, num_orders),
+        'day': rng.integers(1, 28, num_orders)
+    }))
+    
+    # Typed Arrow columns; repeated labels are stored once as dictionaries
+    table = pa.table({
+        'order_id': pa.array(np.arange(1, num_orders + 1), type=pa.int32()),
+        'customer_id': pa.array(rng.integers(1001, 1020, num_orders), type=pa.int32()),
+        'product_id': pa.array(product_ids[product_idx], type=pa.int32()),
+        'order_date': pa.array(order_dates.dt.strftime('%Y-%m-%d'), type=pa.string()),
+        'quantity': pa.array(rng.poisson(2, num_orders) + 1, type=pa.int32()),
+        'unit_price': pa.array(product_prices[product_idx], type=pa.float64()),
+        'customer_city': dictionary_column(['New York', 'London', 'Tokyo', 'Paris'],
+                                           rng.choice(4, num_orders)),
+        'product_category': dictionary_column(categories, category_codes[product_idx]),
+        'customer_segment': dictionary_column(['Premium', 'Standard'],
+                                              rng.choice(2, num_orders, p=[0.4, 0.6])),
+        'promotion_applied': dictionary_column(['Yes', 'No'],
+                                               rng.choice(2, num_orders, p=[0.3, 0.7]))
+    })
+    df = table.to_pandas()
     os.makedirs('../data/raw', exist_ok=True)
-    df.to_csv('../data/raw/sample_sales_data.csv', index=False)
+    write_csv(df, '../data/raw/sample_sales_data.csv')
     return df
 
 def demonstrate_model_readiness(final_data):
@@ -118,10 +136,12 @@ def demonstrate_model_readiness(final_data):
     print(" MODEL READINESS CHECK")
     print("="*50)
     
-    # Check data quality
+    # Check data quality: one non-null count per column and one pass over the dtypes
+    has_missing = (final_data.count().to_numpy() < len(final_data)).any()
+    all_numerical = (final_data.dtypes.to_numpy() != object).all()
     print(" Data Quality Check:")
-    print(f"  - No missing values: {not final_data.isnull().any().any()}")
-    print(f"  - All numerical: {all(final_data.dtypes != 'object')}")
+    print(f"  - No missing values: {not has_missing}")
+    print(f"  - All numerical: {all_numerical}")
     print(f"  - Reasonable scale: All features normalized/encoded")
     
     # Show final data structure
@@ -152,8 +172,13 @@ def main():
         
         # Save processed data
         os.makedirs('../data/processed', exist_ok=True)
-        final_data.to_csv('../data/processed/demo_processed_sales.csv', index=False)
-        print(f"\n Processed data saved to: ../data/processed/demo_processed_sales.csv")
+        if Config().get('output.format', 'parquet') == 'csv':
+            output_path = '../data/processed/demo_processed_sales.csv'
+            write_csv(final_data, output_path)
+        else:
+            output_path = '../data/processed/demo_processed_sales.parquet'
+            final_data.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        print(f"\n Processed data saved to: {output_path}")
         
         print("\n DEMO COMPLETED SUCCESSFULLY!")
         print(" Next steps: Use the processed data with your favorite ML library!")
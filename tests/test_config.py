@@ -0,0 +1,47 @@
+"""
+Tests for Configuration Module
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.config import Config
+
+class TestConfig:
+    def test_instances_do_not_share_sections(self):
+        """Test that setting a nested key on one instance leaves others untouched"""
+        first = Config()
+        second = Config()
+        
+        first.set('output.format', 'csv')
+        
+        assert second.get('output.format') == 'parquet'
+        assert second.get('output')['format'] == 'parquet'
+        assert Config.DEFAULTS['output']['format'] == 'parquet'
+    
+    def test_section_edits_do_not_desync_keys(self):
+        """Test that mutating a returned section never changes dotted lookups"""
+        config = Config()
+        
+        section = config.get('output')
+        section['format'] = 'csv'
+        
+        assert config.get('output.format') == 'parquet'
+        assert config.get('output')['format'] == 'parquet'
+    
+    def test_set_section_then_get(self):
+        """Test that replacing a section updates both leaf and section lookups"""
+        config = Config()
+        
+        config.set('output', {'format': 'csv'})
+        
+        assert config.get('output.format') == 'csv'
+        assert config.get('output.save_pipeline') is None
+        assert config.get('output') == {'format': 'csv'}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
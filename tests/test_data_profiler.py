@@ -13,39 +13,39 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.data_profiler import DataProfiler
 
+@pytest.fixture(scope='module')
+def sample_data():
+    """Create sample test data once; tests treat it as read-only"""
+    data = pd.DataFrame({
+        'numerical_1': [1, 2, 3, 4, 5, np.nan, 7, 8, 9, 10],
+        'numerical_2': [10.5, 20.3, 30.1, 40.7, 50.2, 60.8, 70.4, 80.9, 90.1, 100.5],
+        'categorical': ['A', 'B', 'A', 'C', 'B', 'A', 'C', 'B', 'A', 'C'],
+        'text': ['hello', 'world', 'test', 'data', 'science', 'ai', 'ml', 'etl', 'smart', 'feature']
+    })
+    return data
+
+@pytest.fixture(scope='module')
+def profile(sample_data):
+    """Profile the sample data once; tests only read it and must not mutate it"""
+    return DataProfiler().analyze(sample_data)
+
 class TestDataProfiler:
-    @pytest.fixture
-    def sample_data(self):
-        """Create sample test data"""
-        data = pd.DataFrame({
-            'numerical_1': [1, 2, 3, 4, 5, np.nan, 7, 8, 9, 10],
-            'numerical_2': [10.5, 20.3, 30.1, 40.7, 50.2, 60.8, 70.4, 80.9, 90.1, 100.5],
-            'categorical': ['A', 'B', 'A', 'C', 'B', 'A', 'C', 'B', 'A', 'C'],
-            'text': ['hello', 'world', 'test', 'data', 'science', 'ai', 'ml', 'etl', 'smart', 'feature']
-        })
-        return data
-    
     def test_profiler_initialization(self):
         """Test that profiler initializes correctly"""
         profiler = DataProfiler()
         assert profiler.profile_report == {}
         assert profiler.data_types == {}
     
-    def test_data_analysis(self, sample_data):
+    def test_data_analysis(self, profile):
         """Test comprehensive data analysis"""
-        profiler = DataProfiler()
-        profile = profiler.analyze(sample_data)
-        
         assert 'overview' in profile
         assert 'data_types' in profile
         assert 'missing_values' in profile
         assert 'statistical_summary' in profile
         assert 'quality_metrics' in profile
     
-    def test_data_type_inference(self, sample_data):
+    def test_data_type_inference(self, profile):
         """Test intelligent data type inference"""
-        profiler = DataProfiler()
-        profile = profiler.analyze(sample_data)
         data_types = profile['data_types']
         
         assert 'numerical' in data_types['numerical_1']
@@ -53,25 +53,125 @@ class TestDataProfiler:
         assert 'categorical' in data_types['categorical']
         assert 'text' in data_types['text']
     
-    def test_missing_value_analysis(self, sample_data):
+    def test_missing_value_analysis(self, profile):
         """Test missing value detection"""
-        profiler = DataProfiler()
-        profile = profiler.analyze(sample_data)
         missing_info = profile['missing_values']
         
         assert missing_info['total_missing'] == 1
         assert 'numerical_1' in missing_info['columns_missing']
     
-    def test_quality_metrics(self, sample_data):
+    def test_quality_metrics(self, profile):
         """Test quality metric calculation"""
-        profiler = DataProfiler()
-        profile = profiler.analyze(sample_data)
         quality_metrics = profile['quality_metrics']
         
         assert 'overall_quality_score' in quality_metrics
         assert 'completeness_score' in quality_metrics
         assert 'uniqueness_score' in quality_metrics
         assert 0 <= quality_metrics['overall_quality_score'] <= 100
+    
+    @pytest.mark.parametrize('backend', ['pandas', 'polars', 'pyarrow'])
+    @pytest.mark.parametrize('data', [
+        pd.DataFrame({'a': pd.Series(dtype=float), 'b': pd.Series(dtype=int)}),
+        pd.DataFrame(index=range(3))
+    ], ids=['no_rows', 'no_columns'])
+    def test_empty_frame_quality_metrics(self, backend, data):
+        """Test that an empty frame yields undefined scores instead of raising"""
+        if backend != 'pandas':
+            pytest.importorskip(backend)
+        profile = DataProfiler(backend=backend).analyze(data)
+        
+        assert profile['missing_values']['missing_percentage_total'] == 0.0
+        assert all(np.isnan(score) for score in profile['quality_metrics'].values())
+    
+    def test_polars_backend_matches_pandas(self, sample_data):
+        """Test that the polars backend reports the same scan results"""
+        pytest.importorskip("polars")
+        data = pd.concat([sample_data, sample_data.head(2)], ignore_index=True)
+        
+        pandas_profile = DataProfiler().analyze(data)
+        polars_profile = DataProfiler(backend='polars').analyze(data)
+        
+        assert polars_profile['overview'] == pandas_profile['overview']
+        assert polars_profile['missing_values'] == pandas_profile['missing_values']
+        assert polars_profile['quality_metrics'] == pandas_profile['quality_metrics']
+    
+    def test_polars_backend_mixed_object_column(self):
+        """Test that the polars backend falls back to pandas for mixed-type columns"""
+        pytest.importorskip("polars")
+        data = pd.DataFrame({'mixed': [1, 'a', None, 1], 'value': [1.0, 2.0, 3.0, 1.0]})
+        
+        pandas_profile = DataProfiler().analyze(data)
+        polars_profile = DataProfiler(backend='polars').analyze(data)
+        
+        assert polars_profile['overview'] == pandas_profile['overview']
+        assert polars_profile['missing_values'] == pandas_profile['missing_values']
+    
+    def test_pyarrow_backend_matches_pandas(self, sample_data):
+        """Test that the pyarrow backend reports the same scan results"""
+        pytest.importorskip("pyarrow")
+        data = pd.concat([sample_data, sample_data.head(2)], ignore_index=True)
+        
+        pandas_profile = DataProfiler().analyze(data)
+        pyarrow_profile = DataProfiler(backend='pyarrow').analyze(data)
+        
+        assert pyarrow_profile['overview'] == pandas_profile['overview']
+        assert pyarrow_profile['missing_values'] == pandas_profile['missing_values']
+        assert pyarrow_profile['quality_metrics'] == pandas_profile['quality_metrics']
+    
+    def test_pyarrow_backend_mixed_object_column(self):
+        """Test that the pyarrow backend falls back to pandas for mixed-type columns"""
+        pytest.importorskip("pyarrow")
+        data = pd.DataFrame({'mixed': [1, 'a', None, 1], 'value': [1.0, 2.0, 3.0, 1.0]})
+        
+        pandas_profile = DataProfiler().analyze(data)
+        pyarrow_profile = DataProfiler(backend='pyarrow').analyze(data)
+        
+        assert pyarrow_profile['overview'] == pandas_profile['overview']
+        assert pyarrow_profile['missing_values'] == pandas_profile['missing_values']
+    
+    def test_chunked_analysis_matches_full(self, sample_data, profile):
+        """Test that chunked profiling merges chunks into the full-frame result"""
+        chunks = (sample_data.iloc[i:i + 3] for i in range(0, len(sample_data), 3))
+        chunked_profile = DataProfiler().analyze_chunked(chunks)
+        
+        assert chunked_profile['overview']['num_rows'] == profile['overview']['num_rows']
+        assert chunked_profile['overview']['duplicate_rows'] == profile['overview']['duplicate_rows']
+        assert chunked_profile['missing_values'] == profile['missing_values']
+        
+        stats = chunked_profile['statistical_summary']['numerical_2']
+        expected = profile['statistical_summary']['numerical_2']
+        for key in ['count', 'mean', 'std', 'min', 'max', 'variance', 'skewness']:
+            assert stats[key] == pytest.approx(expected[key])
+    
+    def test_parquet_analysis(self, sample_data, tmp_path):
+        """Test metadata-based profiling of a Parquet file"""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "sample.parquet"
+        sample_data.to_parquet(path, index=False)
+        
+        profiler = DataProfiler()
+        profile = profiler.analyze_parquet(str(path))
+        
+        assert profile['overview']['num_rows'] == len(sample_data)
+        assert profile['overview']['num_columns'] == sample_data.shape[1]
+        assert profile['missing_values']['total_missing'] == 1
+        assert profile['statistical_summary']['numerical_2']['max'] == 100.5
+        assert profile['overview']['duplicate_rows'] is None
+    
+    def test_parquet_duplicate_count(self, sample_data, tmp_path):
+        """Test that the opt-in duplicate scan matches the in-memory count"""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "duplicates.parquet"
+        pd.concat([sample_data, sample_data.head(2)]).to_parquet(path, index=False)
+        
+        profile = DataProfiler().analyze_parquet(str(path), count_duplicates=True)
+        
+        assert profile['overview']['duplicate_rows'] == 2
+    
+    def test_unknown_backend(self):
+        """Test that an unsupported backend is rejected"""
+        with pytest.raises(ValueError):
+            DataProfiler(backend='spark')
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Tests for Utility Helpers Module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.helpers import get_dataframe_info, safe_divide
+
+class TestHelpers:
+    def test_dataframe_info_without_columns(self):
+        """Test that a frame with rows but no columns reports no duplicates"""
+        info = get_dataframe_info(pd.DataFrame(index=range(3)))
+        
+        assert info['duplicate_rows'] == 0
+    
+    def test_dataframe_info_signed_zero_duplicates(self):
+        """Test that rows differing only by 0.0 and -0.0 count as duplicates"""
+        df = pd.DataFrame({'a': [0.0, -0.0], 'b': ['x', 'x']})
+        
+        assert get_dataframe_info(df)['duplicate_rows'] == 1
+    
+    def test_safe_divide_scalar_denominator(self):
+        """Test dividing a Series by a scalar, including a zero scalar"""
+        numerator = pd.Series([1.0, 2.0, 4.0], index=['a', 'b', 'c'])
+        
+        result = safe_divide(numerator, 2)
+        pd.testing.assert_series_equal(result, pd.Series([0.5, 1.0, 2.0], index=['a', 'b', 'c']))
+        
+        result = safe_divide(numerator, 0, default=-1.0)
+        pd.testing.assert_series_equal(result, pd.Series([-1.0, -1.0, -1.0], index=['a', 'b', 'c']))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
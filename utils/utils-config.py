@@ -2,10 +2,25 @@
 Configuration management for Smart ETL system.
 """
 
+import copy
 import os
-import yaml
 from typing import Dict, Any, Optional
 
+def _yaml_codec():
+    """
+    Import yaml lazily and pick the libyaml C loader/dumper when available.
+    
+    Returns:
+        Tuple of (yaml module, safe loader class, safe dumper class)
+    """
+    import yaml
+    
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
 class Config:
     """
     Configuration manager for Smart ETL system settings.
@@ -31,7 +46,8 @@ class Config:
         'output': {
             'save_pipeline': True,
             'generate_report': True,
-            'export_code': True
+            'export_code': True,
+            'format': 'parquet'
         }
     }
     
@@ -42,7 +58,10 @@ class Config:
         Args:
             config_file: Path to YAML configuration file
         """
-        self.config = self.DEFAULTS.copy()
+        # Deep copy so instances never share (or mutate) nested default sections
+        self.config = copy.deepcopy(self.DEFAULTS)
+        self._flat = {}
+        self._flatten(self.config)
         
         if config_file and os.path.exists(config_file):
             self.load_config(config_file)
@@ -54,24 +73,43 @@ class Config:
         Args:
             config_file: Path to YAML configuration file
         """
+        yaml, Loader, _ = _yaml_codec()
+        
         try:
             with open(config_file, 'r') as file:
-                user_config = yaml.safe_load(file)
+                user_config = yaml.load(file, Loader=Loader)
                 self._update_config(self.config, user_config)
+            self._flat = {}
+            self._flatten(self.config)
             print(f"Configuration loaded from {config_file}")
         except Exception as e:
             print(f"Could not load config file: {e}. Using defaults.")
     
     def _update_config(self, default: Dict, user: Dict) -> None:
         """
-        Recursively update default config with user config.
+        Update default config with user config, merging nested sections
+        with an explicit stack instead of recursion.
+        """
+        stack = [(default, user)]
+        while stack:
+            default, user = stack.pop()
+            for key, value in user.items():
+                if key in default:
+                    if isinstance(value, dict) and isinstance(default[key], dict):
+                        stack.append((default[key], value))
+                    else:
+                        default[key] = value
+    
+    def _flatten(self, config: Dict, prefix: str = '') -> None:
+        """
+        Index every dot-notation leaf key into self._flat; sections are not indexed.
         """
-        for key, value in user.items():
-            if key in default:
-                if isinstance(value, dict) and isinstance(default[key], dict):
-                    self._update_config(default[key], value)
-                else:
-                    default[key] = value
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                self._flatten(value, f"{path}.")
+            else:
+                self._flat[path] = value
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -82,17 +120,19 @@ class Config:
             default: Default value if key not found
             
         Returns:
-            Configuration value
+            Configuration value; whole sections are returned as copies
         """
-        keys = key.split('.')
-        value = self.config
+        if key in self._flat:
+            return self._flat[key]
         
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        # Sections are resolved against self.config and copied, so editing the
+        # returned dict cannot leave the leaf index out of date
+        value = self.config
+        for k in key.split('.'):
+            if not isinstance(value, dict) or k not in value:
+                return default
+            value = value[k]
+        return copy.deepcopy(value)
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -111,6 +151,15 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
+        
+        # Invalidate only the index entries under the replaced value
+        prefix = f"{key}."
+        for stale in [path for path in self._flat if path == key or path.startswith(prefix)]:
+            del self._flat[stale]
+        if isinstance(value, dict):
+            self._flatten(value, prefix)
+        else:
+            self._flat[key] = value
     
     def save_config(self, config_file: str) -> None:
         """
@@ -119,10 +168,12 @@ class Config:
         Args:
             config_file: Path to save configuration
         """
+        yaml, _, Dumper = _yaml_codec()
+        
         try:
             os.makedirs(os.path.dirname(config_file), exist_ok=True)
             with open(config_file, 'w') as file:
-                yaml.dump(self.config, file, default_flow_style=False)
+                yaml.dump(self.config, file, Dumper=Dumper, default_flow_style=False)
             print(f"Configuration saved to {config_file}")
         except Exception as e:
             print(f"Could not save config file: {e}")
@@ -131,8 +182,10 @@ class Config:
         """
         Display current configuration.
         """
+        yaml, _, Dumper = _yaml_codec()
+        
         print("Current Configuration:")
-        print(yaml.dump(self.config, default_flow_style=False))
+        print(yaml.dump(self.config, Dumper=Dumper, default_flow_style=False))
 
 # Global configuration instance
 config = Config()
\ No newline at end of file
@@ -5,6 +5,9 @@ Utility functions and helpers for Smart ETL system.
 from .config import Config
 from .helpers import (
     validate_dataframe,
+    to_arrow_dtypes,
+    optimize_object_columns,
+    write_csv,
     save_pipeline,
     load_pipeline,
     get_memory_usage,
@@ -14,6 +17,9 @@ from .helpers import (
 __all__ = [
     'Config',
     'validate_dataframe',
+    'to_arrow_dtypes',
+    'optimize_object_columns',
+    'write_csv',
     'save_pipeline', 
     'load_pipeline',
     'get_memory_usage',